@@ -15,24 +15,57 @@ import time
 import os
 import sys
 import threading
+import queue
+import zlib
+import base64
+import re
+from functools import cached_property
 from pathlib import Path
-import sounddevice as sd
-import soundfile as sf
-import pystray
-from PIL import Image, ImageDraw
 import winreg
 
+# numpy, sounddevice, soundfile, pystray and PIL are imported where they are
+# used, so --help doesn't pay for loading PortAudio, libsndfile or Pillow
+
+
+# Pre-rendered 64x64 RGB tray icon (speaker with sound waves), zlib-compressed
+# and base64-encoded so no drawing is needed at startup
+_ICON_SIZE = (64, 64)
+_ICON_DATA = (
+    b"eNrtmcsOgCAMBPf/f7peTXxEAlK2zBz1MhsTC9sIAAAA2AVJ1vKm/jphLe/lrzus5S389Yq1"
+    b"/Mr++oa1/Bx//cmEGZfu3xkh0X/IV0j374yAf5N/6/M1/a9vXfyfbL38B0bAf9T8xR9//Pn/"
+    b"4F94/rqff9zPn9xfuP/SP+TuOJbq3zbsPwv0zzX6/wL7lxr7r6cUYYi7f+5sGhshAAAAduUA"
+    b"eOEE9g=="
+)
+
+
+def _dumps_settings(settings):
+    """Serialize settings to JSON bytes, indented for hand editing"""
+    return json.dumps(settings, indent=4).encode('utf-8')
+
 
 class TonePlayer:
     def __init__(self, settings_file="player_settings.json"):
         self.settings_file = settings_file
+        self._settings_mtime = None
         self.settings = self.load_settings()
+        self._audio_path = self.get_audio_path()
+        self._audio_cache = {}
+        self._stream = None
+        self._stream_config = None
+        self._stream_lock = threading.Lock()
+        self._play_queue = queue.Queue()
+        self._play_thread = None
+        self._shutting_down = False
         self.running = False
+        self._wake_event = threading.Event()
         self.timer_thread = None
         self.icon = None
+        self._startup_enabled = self._query_startup()
+        self._startup_cmd = self._build_startup_command()
     
-    def get_base_path(self):
-        """Get the base path for the application (works for both .py and .exe)"""
+    @cached_property
+    def base_path(self):
+        """Base path for the application (works for both .py and .exe)"""
         if getattr(sys, 'frozen', False):
             # Running as compiled exe
             return Path(sys.executable).parent
@@ -41,31 +74,182 @@ class TonePlayer:
             return Path(__file__).parent
         
     def load_settings(self):
-        """Load settings from JSON file"""
-        settings_path = self.get_base_path() / self.settings_file
+        """Load settings from JSON file (skips parsing if the file is unchanged)"""
+        settings_path = self.base_path / self.settings_file
         
-        if not settings_path.exists():
+        try:
+            mtime = settings_path.stat().st_mtime_ns
+        except FileNotFoundError:
             # Create default settings
             default_settings = {
                 "tone_file": "tone.wav",
                 "interval_minutes": 10
             }
-            with open(settings_path, 'w') as f:
-                json.dump(default_settings, f, indent=4)
+            self._write_settings(default_settings)
             self.log(f"Created default settings file: {settings_path}")
             return default_settings
         
+        if mtime == self._settings_mtime:
+            # In-memory settings already match the file
+            return self.settings
+        
         with open(settings_path, 'r') as f:
             settings = json.load(f)
+        self._settings_mtime = mtime
         
         return settings
     
     def get_audio_path(self):
         """Get the full path to the audio file"""
         tone_file = self.settings.get("tone_file", "tone.wav")
-        audio_path = self.get_base_path() / tone_file
+        audio_path = self.base_path / tone_file
         return audio_path
     
+    def _get_audio_data(self):
+        """Get the decoded audio data, decoding from disk only when the file changed"""
+        audio_path = self._audio_path
+        audio_stat = audio_path.stat()
+        cache_key = (str(audio_path), audio_stat.st_mtime_ns, audio_stat.st_size)
+        
+        cached = self._audio_cache.get(cache_key)
+        if cached is None:
+            # Keep only the current file's buffer; release the old mapping first
+            # so its .npy file can be removed on Windows
+            self._audio_cache.clear()
+            cached = self._load_decoded_audio(audio_path, audio_stat)
+            self._audio_cache[cache_key] = cached
+        
+        return cached
+    
+    def _load_decoded_audio(self, audio_path, audio_stat):
+        """Load decoded audio as a memory-mapped .npy file next to the source, decoding it if needed"""
+        import numpy as np
+        import soundfile as sf
+        
+        # Play at the file's own sample rate; WASAPI (auto_convert) and the other
+        # Windows host APIs resample to the device rate with a proper filter
+        samplerate = sf.info(str(audio_path)).samplerate
+        
+        # The name records the exact source size and modification time, so any
+        # replacement of the audio file (even with an older timestamp) is decoded again
+        decoded_path = audio_path.with_name(
+            f"{audio_path.name}.{audio_stat.st_size}-{audio_stat.st_mtime_ns}.f32.npy"
+        )
+        
+        # Reuse the decoded file if it exists; the OS page cache then holds
+        # the samples instead of the process
+        try:
+            return np.load(decoded_path, mmap_mode='r'), samplerate
+        except (OSError, ValueError):
+            pass
+        
+        # Decode straight to float32, the stream's native sample format
+        data, samplerate = sf.read(str(audio_path), dtype='float32')
+        
+        temp_path = decoded_path.with_name(decoded_path.name + ".tmp")
+        try:
+            with open(temp_path, 'wb') as f:
+                np.save(f, data)
+            os.replace(temp_path, decoded_path)
+            data = np.load(decoded_path, mmap_mode='r')
+        except OSError as e:
+            # Folder may be read-only - keep the decoded samples in memory instead
+            self.log(f"Could not save decoded audio: {e}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return data, samplerate
+        
+        # Remove decoded copies of older versions of this audio file (and no other)
+        decoded_pattern = re.compile(re.escape(audio_path.name) + r"\.\d+-\d+\.f32\.npy")
+        for path in audio_path.parent.iterdir():
+            if path != decoded_path and decoded_pattern.fullmatch(path.name):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        
+        return data, samplerate
+    
+    def _get_stream(self, data, samplerate):
+        """Get an output stream matching the audio format, reopening only if it changed"""
+        import sounddevice as sd
+        
+        channels = 1 if data.ndim == 1 else data.shape[1]
+        config = (samplerate, channels, data.dtype.name)
+        
+        if self._stream is None or self._stream_config != config:
+            self._close_stream()
+            stream_args = dict(
+                samplerate=samplerate,
+                channels=channels,
+                dtype=data.dtype.name,
+                latency='low',
+                blocksize=256
+            )
+            
+            wasapi_device = self._find_wasapi_device()
+            if wasapi_device is not None:
+                try:
+                    # Shared mode keeps the soundbar available to other applications
+                    self._stream = sd.OutputStream(
+                        device=(None, wasapi_device),
+                        extra_settings=sd.WasapiSettings(auto_convert=True),
+                        **stream_args
+                    )
+                except sd.PortAudioError as e:
+                    self.log(f"WASAPI unavailable, using default audio device: {e}")
+                    self._stream = None
+            
+            if self._stream is None:
+                self._stream = sd.OutputStream(**stream_args)
+            
+            self._stream_config = config
+        
+        return self._stream
+    
+    def _find_wasapi_device(self):
+        """Get the default WASAPI output device index, or None if WASAPI is not available"""
+        import sounddevice as sd
+        
+        try:
+            for hostapi in sd.query_hostapis():
+                if "WASAPI" in hostapi['name']:
+                    device = hostapi['default_output_device']
+                    if device >= 0:
+                        sd.query_devices(device, 'output')  # Make sure it is an output device
+                        return device
+        except Exception:
+            pass
+        return None
+    
+    def _close_stream(self):
+        """Stop and close the output stream if one is open"""
+        if self._stream is not None:
+            try:
+                self._stream.stop()  # Let any buffered audio finish playing
+            except Exception:
+                pass
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+            self._stream_config = None
+    
+    def _reset_audio(self):
+        """Drop the output stream and re-scan audio devices (call with _stream_lock held)"""
+        self._close_stream()
+        try:
+            # PortAudio only enumerates devices at initialization; restart it so a
+            # soundbar that was unplugged or powered off gets a current device index
+            import sounddevice as sd
+            sd._terminate()
+            sd._initialize()
+        except Exception:
+            pass
+    
     def log(self, message, end="\n"):
         """Log message to console (if available)"""
         try:
@@ -76,7 +260,7 @@ class TonePlayer:
     def play_audio(self):
         """Play the configured audio file (supports WAV, FLAC, OGG)"""
         try:
-            audio_path = self.get_audio_path()
+            audio_path = self._audio_path
             
             if not audio_path.exists():
                 self.log(f"❌ Audio file not found: {audio_path}")
@@ -86,15 +270,32 @@ class TonePlayer:
             
             self.log(f"🔊 Playing: {audio_path.name} ... ", end="")
             
-            # Load audio file
+            # Load audio file (decoded once, then reused from cache)
             try:
-                data, samplerate = sf.read(str(audio_path))
+                import sounddevice as sd
+                
+                data, samplerate = self._get_audio_data()
                 
-                # Play the audio
-                sd.play(data, samplerate)
-                sd.wait()  # Wait until playback is finished
+                # Play the audio through the persistent stream
+                with self._stream_lock:
+                    if self._shutting_down:
+                        return False  # Don't reopen the stream while quitting
+                    try:
+                        stream = self._get_stream(data, samplerate)
+                        # Only run the stream while playing, so it isn't rendering
+                        # silence (and keeping Windows awake) between tones
+                        stream.start()
+                        try:
+                            stream.write(data)
+                        finally:
+                            stream.stop()  # Waits for the buffered audio to finish
+                    except sd.PortAudioError:
+                        # Device failed (e.g. soundbar unplugged) - start fresh on the next play
+                        self._reset_audio()
+                        raise
                 
-                self.log(f"✓ Played at {time.strftime('%H:%M:%S')}")
+                now = time.localtime()
+                self.log(f"✓ Played at {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}")
                 return True
                 
             except RuntimeError as e:
@@ -109,19 +310,73 @@ class TonePlayer:
                 self.icon.notify("Error", str(e))
             return False
     
+    def _raise_thread_priority(self, thread):
+        """Raise a thread to above-normal priority so playback isn't delayed by busy processes"""
+        THREAD_SET_INFORMATION = 0x0020
+        THREAD_PRIORITY_ABOVE_NORMAL = 1
+        try:
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            # Declare signatures so the HANDLE isn't truncated to a C int on 64-bit Python
+            kernel32.OpenThread.restype = wintypes.HANDLE
+            kernel32.OpenThread.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+            kernel32.SetThreadPriority.restype = wintypes.BOOL
+            kernel32.SetThreadPriority.argtypes = (wintypes.HANDLE, ctypes.c_int)
+            kernel32.CloseHandle.restype = wintypes.BOOL
+            kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+            handle = kernel32.OpenThread(THREAD_SET_INFORMATION, False, thread.native_id)
+            if handle:
+                kernel32.SetThreadPriority(handle, THREAD_PRIORITY_ABOVE_NORMAL)
+                kernel32.CloseHandle(handle)
+        except Exception:
+            pass  # Not on Windows or not permitted - keep default priority
+    
+    def _play_worker(self):
+        """Play queued requests one at a time (a False item stops the worker)"""
+        while self._play_queue.get():
+            self.play_audio()
+    
+    def start_play_worker(self):
+        """Start the single thread that serves all play requests"""
+        if self._play_thread is None:
+            self._play_thread = threading.Thread(target=self._play_worker, daemon=True)
+            self._play_thread.start()
+            self._raise_thread_priority(self._play_thread)
+    
+    def request_play(self):
+        """Queue the audio to be played by the play worker"""
+        self._play_queue.put(True)
+    
+    def get_interval_minutes(self):
+        """Get the play interval, falling back to the default if it isn't positive"""
+        interval_minutes = self.settings.get("interval_minutes", 10)
+        if interval_minutes <= 0:
+            # A zero or negative value in a hand-edited settings file would
+            # otherwise flood the player with back-to-back tones
+            return 10
+        return interval_minutes
+    
     def timer_loop(self):
         """Background loop that plays tone at intervals"""
-        while self.running:
-            interval_minutes = self.settings.get("interval_minutes", 10)
+        last_played = None  # Time the last play was requested
+        while True:
+            # Clear before checking running, so a stop_timer() in between isn't lost
+            self._wake_event.clear()
+            if not self.running:
+                break
+            
+            # Re-read each pass so interval changes apply without a restart
+            interval_minutes = self.get_interval_minutes()
             interval_seconds = interval_minutes * 60
             
-            self.play_audio()
+            now = time.monotonic()
+            if last_played is None or now >= last_played + interval_seconds:
+                self.request_play()
+                last_played = now
             
-            # Sleep in small intervals to allow for quick shutdown
-            for _ in range(int(interval_seconds)):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Wait until the next deadline, waking early on shutdown or interval change
+            self._wake_event.wait(last_played + interval_seconds - time.monotonic())
     
     def start_timer(self):
         """Start the timer loop"""
@@ -129,47 +384,59 @@ class TonePlayer:
             self.running = True
             self.timer_thread = threading.Thread(target=self.timer_loop, daemon=True)
             self.timer_thread.start()
+            self._raise_thread_priority(self.timer_thread)
             self.log("✅ Started tone player timer")
             if self.icon:
-                interval = self.settings.get("interval_minutes", 10)
+                interval = self.get_interval_minutes()
                 self.icon.notify("Tone Player Started", f"Playing every {interval} minute(s)")
     
     def stop_timer(self):
         """Stop the timer loop"""
         if self.running:
             self.running = False
+            self._wake_event.set()
             if self.timer_thread:
                 self.timer_thread.join(timeout=2)
             self.log("🛑 Stopped tone player timer")
     
     def set_interval(self, minutes):
         """Set the interval and save to settings"""
+        if self.settings.get("interval_minutes") == minutes:
+            return  # Already set, nothing to save
+        
         self.settings["interval_minutes"] = minutes
         self.save_settings()
         
-        # Restart timer with new interval
-        was_running = self.running
-        if was_running:
-            self.stop_timer()
-            time.sleep(0.5)
-            self.start_timer()
-        else:
-            # Update menu to show new setting
-            if self.icon:
-                self.icon.menu = self.create_menu()
+        # Wake the timer so it reschedules with the new interval
+        self._wake_event.set()
         
         if self.icon:
+            # Refresh menu check marks to show new setting
+            self.icon.update_menu()
             self.icon.notify("Interval Updated", f"Now playing every {minutes} minute(s)")
     
+    def _write_settings(self, settings):
+        """Write settings to the JSON file and remember its modification time"""
+        settings_path = self.base_path / self.settings_file
+        
+        # Write to a temp file and swap it in, so a crash can't leave a torn file
+        temp_path = settings_path.with_suffix('.json.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(_dumps_settings(settings))
+        os.replace(temp_path, settings_path)
+        
+        self._settings_mtime = settings_path.stat().st_mtime_ns
+    
     def save_settings(self):
         """Save current settings to JSON file"""
-        settings_path = self.get_base_path() / self.settings_file
-        with open(settings_path, 'w') as f:
-            json.dump(self.settings, f, indent=4)
+        self._write_settings(self.settings)
+        
+        # Settings changed, so refresh the resolved audio path
+        self._audio_path = self.get_audio_path()
     
     def open_settings_file(self):
         """Open the settings JSON file in default editor"""
-        settings_path = self.get_base_path() / self.settings_file
+        settings_path = self.base_path / self.settings_file
         try:
             os.startfile(str(settings_path))
             if self.icon:
@@ -181,60 +448,63 @@ class TonePlayer:
         """Get the Windows registry key for startup programs"""
         return r"Software\Microsoft\Windows\CurrentVersion\Run"
     
-    def is_startup_enabled(self):
-        """Check if the app is set to start with Windows"""
+    def _query_startup(self):
+        """Check the registry for the startup entry"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_key(), 0, winreg.KEY_READ)
-            try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_key(), 0, winreg.KEY_READ) as key:
                 winreg.QueryValueEx(key, "SoundbarTonePlayer")
-                winreg.CloseKey(key)
                 return True
-            except WindowsError:
-                winreg.CloseKey(key)
-                return False
-        except:
+        except OSError:
             return False
     
+    def is_startup_enabled(self):
+        """Check if the app is set to start with Windows (cached registry lookup)"""
+        return self._startup_enabled
+    
+    def _build_startup_command(self):
+        """Build the command line used to start the app with Windows"""
+        if getattr(sys, 'frozen', False):
+            # We are running in a bundle (e.g., PyInstaller .exe)
+            return f'"{sys.executable}"'
+        
+        # We are running as a .py script
+        script_path = str(Path(__file__).resolve())
+        python_exe = sys.executable
+        # Use pythonw.exe to run without console window
+        python_no_console = python_exe.replace("python.exe", "pythonw.exe")
+        if os.path.exists(python_no_console):
+            python_exe = python_no_console
+        return f'"{python_exe}" "{script_path}"'
+    
     def toggle_startup(self, item=None):
         """Toggle startup with Windows"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_key(), 0, winreg.KEY_ALL_ACCESS)
-            
-            if self.is_startup_enabled():
-                # Remove from startup
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_key(), 0, winreg.KEY_ALL_ACCESS) as key:
+                # Check the current value on the same handle, in case it changed outside the app
                 try:
+                    winreg.QueryValueEx(key, "SoundbarTonePlayer")
+                    self._startup_enabled = True
+                except OSError:
+                    self._startup_enabled = False
+                
+                if self._startup_enabled:
+                    # Remove from startup
                     winreg.DeleteValue(key, "SoundbarTonePlayer")
+                    self._startup_enabled = False
                     self.log("Removed from Windows startup")
                     if self.icon:
                         self.icon.notify("Startup Disabled", "App will not start with Windows")
-                except:
-                    pass
-            else:
-                # Add to startup
-                if getattr(sys, 'frozen', False):
-                    # We are running in a bundle (e.g., PyInstaller .exe)
-                    exe_path = sys.executable
-                    startup_command = f'"{exe_path}"'
                 else:
-                    # We are running as a .py script
-                    script_path = str(Path(__file__).resolve())
-                    python_exe = sys.executable
-                    # Use pythonw.exe to run without console window
-                    python_no_console = python_exe.replace("python.exe", "pythonw.exe")
-                    if os.path.exists(python_no_console):
-                        python_exe = python_no_console
-                    startup_command = f'"{python_exe}" "{script_path}"'
-                    
-                winreg.SetValueEx(key, "SoundbarTonePlayer", 0, winreg.REG_SZ, startup_command)
-                self.log(f"Added to Windows startup with command: {startup_command}")
-                if self.icon:
-                    self.icon.notify("Startup Enabled", "App will start with Windows")
-            
-            winreg.CloseKey(key)
+                    # Add to startup
+                    winreg.SetValueEx(key, "SoundbarTonePlayer", 0, winreg.REG_SZ, self._startup_cmd)
+                    self._startup_enabled = True
+                    self.log(f"Added to Windows startup with command: {self._startup_cmd}")
+                    if self.icon:
+                        self.icon.notify("Startup Enabled", "App will start with Windows")
             
-            # Update menu
+            # Refresh menu check marks
             if self.icon:
-                self.icon.menu = self.create_menu()
+                self.icon.update_menu()
                 
         except Exception as e:
             self.log(f"Error toggling startup: {e}")
@@ -242,25 +512,14 @@ class TonePlayer:
                 self.icon.notify("Error", "Could not modify startup settings")
     
     def create_icon_image(self):
-        """Create a simple icon for the system tray"""
-        width = 64
-        height = 64
-        image = Image.new('RGB', (width, height), 'white')
-        draw = ImageDraw.Draw(image)
+        """Create the system tray icon from the pre-rendered image data"""
+        from PIL import Image
         
-        # Draw speaker shape
-        draw.rectangle([10, 20, 25, 44], fill='black')
-        draw.polygon([25, 20, 40, 10, 40, 54, 25, 44], fill='black')
-        
-        # Draw sound waves
-        draw.arc([42, 25, 52, 39], 270, 90, fill='black', width=2)
-        draw.arc([45, 20, 57, 44], 270, 90, fill='black', width=2)
-        
-        return image
+        return Image.frombytes('RGB', _ICON_SIZE, zlib.decompress(base64.b64decode(_ICON_DATA)))
     
     def on_play_now(self, icon, item):
         """Handle play now menu item"""
-        threading.Thread(target=self.play_audio, daemon=True).start()
+        self.request_play()
     
     def on_set_interval_3(self, icon, item):
         """Set interval to 3 minutes"""
@@ -281,15 +540,34 @@ class TonePlayer:
     def on_quit(self, icon, item):
         """Handle quit menu item"""
         self.stop_timer()
+        
+        # Drop pending play requests and stop the worker
+        while True:
+            try:
+                self._play_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._play_queue.put(False)
+        
+        with self._stream_lock:
+            self._shutting_down = True
+            self._close_stream()
         icon.stop()
     
     def create_menu(self):
         """Create the system tray menu"""
-        startup_text = "✓ Start with Windows" if self.is_startup_enabled() else "Start with Windows"
-        current_interval = self.settings.get("interval_minutes", 10)
+        import pystray
+        
+        def interval_is(minutes):
+            # Evaluated by pystray each time the menu is shown
+            return lambda item: self.settings.get("interval_minutes", 10) == minutes
         
         return pystray.Menu(
-            pystray.MenuItem(startup_text, self.toggle_startup),
+            pystray.MenuItem(
+                "Start with Windows",
+                self.toggle_startup,
+                checked=lambda item: self.is_startup_enabled()
+            ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Play Now", self.on_play_now),
             pystray.Menu.SEPARATOR,
@@ -297,16 +575,22 @@ class TonePlayer:
                 "Interval",
                 pystray.Menu(
                     pystray.MenuItem(
-                        f"{'• ' if current_interval == 3 else ''}Every 3 minutes",
-                        self.on_set_interval_3
+                        "Every 3 minutes",
+                        self.on_set_interval_3,
+                        checked=interval_is(3),
+                        radio=True
                     ),
                     pystray.MenuItem(
-                        f"{'• ' if current_interval == 5 else ''}Every 5 minutes",
-                        self.on_set_interval_5
+                        "Every 5 minutes",
+                        self.on_set_interval_5,
+                        checked=interval_is(5),
+                        radio=True
                     ),
                     pystray.MenuItem(
-                        f"{'• ' if current_interval == 10 else ''}Every 10 minutes",
-                        self.on_set_interval_10
+                        "Every 10 minutes",
+                        self.on_set_interval_10,
+                        checked=interval_is(10),
+                        radio=True
                     ),
                     pystray.Menu.SEPARATOR,
                     pystray.MenuItem("Set Custom Interval...", self.on_set_custom_interval)
@@ -318,6 +602,8 @@ class TonePlayer:
     
     def run_systray(self):
         """Run the system tray application"""
+        import pystray
+        
         # Create the icon
         icon_image = self.create_icon_image()
         
@@ -327,7 +613,17 @@ class TonePlayer:
         # Create and run the system tray icon
         self.icon = pystray.Icon("soundbar_tone_player", icon_image, "Soundbar Tone Player", menu)
         
+        # Decode the audio file and open the output stream up front
+        # so the first tone plays without delay
+        try:
+            data, samplerate = self._get_audio_data()
+            with self._stream_lock:
+                self._get_stream(data, samplerate)
+        except Exception as e:
+            self.log(f"❌ Could not preload audio: {e}")
+        
         # Automatically start the timer when app launches
+        self.start_play_worker()
         self.start_timer()
         
         # Run the icon (this blocks until quit)
@@ -353,12 +649,10 @@ class TonePlayer:
 
 def main():
     """Main entry point"""
-    player = TonePlayer()
-    
     # Check for command line arguments
     if len(sys.argv) > 1:
         if sys.argv[1] in ['--test', '-t']:
-            player.test_play()
+            TonePlayer().test_play()
             return
         elif sys.argv[1] in ['--help', '-h']:
             print("""
@@ -396,6 +690,7 @@ System Tray Menu:
             return
     
     # Run the system tray application
+    player = TonePlayer()
     player.run_systray()
 
 
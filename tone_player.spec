@@ -0,0 +1,51 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller build spec for Soundbar Tone Player
+#
+# Build with:  pyinstaller tone_player.spec
+#
+# Uses --onedir (not --onefile) so the app starts without unpacking itself to a
+# temp folder on every launch, and excludes modules the app never imports to
+# keep startup import scanning small.
+import os
+
+
+a = Analysis(
+    ['soundbar_tone_player.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['tkinter', 'unittest', 'pydoc', 'xml', 'test', 'pytest'],
+    noarchive=False,
+)
+
+# Drop any Tcl/Tk libraries pulled in by other packages' hooks
+a.binaries = [b for b in a.binaries if not os.path.basename(b[0]).lower().startswith(('tcl', 'tk'))]
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='SoundbarTonePlayer',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    icon='.icon/Speaker_icon-icons.com_54138.ico',
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='SoundbarTonePlayer',
+)